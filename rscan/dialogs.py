@@ -10,17 +10,16 @@ from inspect import currentframe
 import time
 import tkinter as tk
 from tkinter import font
-from queue import Queue, SimpleQueue
+from queue import SimpleQueue
 from threading import Thread
 from tkinter import ttk
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from types import FrameType
 
-
 from rscan.jsktoolbox.raisetool import Raise
 from rscan.jsktoolbox.attribtool import ReadOnlyClass
 from rscan.jsktoolbox.basetool.data import BData
-from rscan.jsktoolbox.tktool.widgets import CreateToolTip, VerticalScrolledTkFrame
+from rscan.jsktoolbox.tktool.widgets import CreateToolTip
 from rscan.jsktoolbox.tktool.base import TkBase
 
 from rscan.jsktoolbox.edmctool.math import Euclid
@@ -34,14 +33,12 @@ from rscan.jsktoolbox.edmctool.edsm_keys import EdsmKeys
 from rscan.jsktoolbox.tktool.tools import ClipBoard
 
 from rscan.th import ThSystemSearch
-from rscan.tools import Numbers
 from rscan.gfx import Pics
 
 
 class _FontKeys(object, metaclass=ReadOnlyClass):
     """Font keys for Tkinter."""
 
-    FONT: str = "font"  # tk key
     FONT_BOLD: str = "bold"  # tk key
     FONT_NORMAL: str = "normal"  # tk key
     FONT_STRIKE: str = "strike"  # tk key
@@ -53,6 +50,143 @@ class _FontFamily(object, metaclass=ReadOnlyClass):
     HELVETICA: str = "Helvetica"
 
 
+class _RowStyles(object, metaclass=ReadOnlyClass):
+    """Names of ttk style and tags for found systems rows."""
+
+    TREE: str = "Row.Treeview"
+    VISITED: str = "visited"  # tree tag
+    WARN: str = "warn"  # tree tag
+
+
+class _Columns(object, metaclass=ReadOnlyClass):
+    """Columns of found systems tree."""
+
+    COUNT: str = "count"
+    NAME: str = "name"
+    DISTANCE: str = "distance"
+    COPY: str = "copy"
+
+
+class _Tips(object, metaclass=ReadOnlyClass):
+    """Tooltip texts of found systems tree."""
+
+    COPY: str = "Copy to clipboard"
+    JUMP: str = (
+        "Warning. The calculated distance exceeded "
+        "the ship's maximum single jump distance."
+    )
+    PERMIT: str = "Warning. Required permissions to enter this system."
+
+
+def _require(value: Any, expected: Any, class_name: str) -> None:
+    """Check the type of the argument.
+
+    The check is skipped, when python runs in optimized mode (-O).
+    """
+    if __debug__ and not isinstance(value, expected):
+        frame: Optional[FrameType] = currentframe()
+        raise Raise.error(
+            f"{expected} type expected, '{type(value)}' received",
+            TypeError,
+            class_name,
+            frame.f_back if frame else None,
+        )
+
+
+# Tk fonts shared by all dialog windows, created on first use.
+_FONTS: Optional[BData] = None
+
+
+def _shared_fonts(master: tk.Misc) -> BData:
+    """Return container with fonts shared by all dialog windows.
+
+    The Font objects allocate Tcl resources, so they are created only once,
+    when the first window exists, and are reused by every next dialog.
+    The ttk style for found systems tree is configured at the same time,
+    with the row height taken from the font metrics.
+    """
+    global _FONTS
+    if _FONTS is None:
+        fonts = BData()
+        fonts._set_data(
+            key=_FontKeys.FONT_BOLD,
+            value=font.Font(
+                root=master,
+                family=_FontFamily.HELVETICA,
+                size=10,
+                weight=font.BOLD,
+                overstrike=False,
+            ),
+            set_default_type=font.Font,
+        )
+        fonts._set_data(
+            key=_FontKeys.FONT_NORMAL,
+            value=font.Font(
+                root=master,
+                family=_FontFamily.HELVETICA,
+                size=10,
+                overstrike=False,
+            ),
+            set_default_type=font.Font,
+        )
+        fonts._set_data(
+            key=_FontKeys.FONT_STRIKE,
+            value=font.Font(
+                root=master,
+                family=_FontFamily.HELVETICA,
+                size=10,
+                overstrike=True,
+            ),
+            set_default_type=font.Font,
+        )
+        # the row height is measured once, it fits the bold font
+        # and the 16px permit icon
+        linespace: int = fonts._get_data(key=_FontKeys.FONT_BOLD).metrics("linespace")  # type: ignore
+        ttk.Style(master).configure(
+            _RowStyles.TREE,
+            font=fonts._get_data(key=_FontKeys.FONT_NORMAL),
+            rowheight=max(linespace, 16) + 4,
+        )
+        _FONTS = fonts
+    return _FONTS
+
+
+# Tk images shared by all dialog windows, keyed by the image data.
+_IMAGES: Dict[str, tk.PhotoImage] = {}
+
+
+def _shared_image(master: tk.Misc, data: str) -> tk.PhotoImage:
+    """Return image shared by all dialog windows.
+
+    The image data is decoded only once per process, the Tk image
+    belongs to the interpreter, so it outlives the window that created it.
+    """
+    image: Optional[tk.PhotoImage] = _IMAGES.get(data)
+    if image is None:
+        image = tk.PhotoImage(master=master, data=data)
+        _IMAGES[data] = image
+    return image
+
+
+# Number of the tree rows inserted by one idle callback.
+_ROWS_CHUNK: int = 50
+
+# System clipboard tool shared by all dialog windows, created on first use.
+_CLIP: Optional[ClipBoard] = None
+
+
+def _shared_clip() -> ClipBoard:
+    """Return clipboard tool shared by all dialog windows.
+
+    The tool probes the system for clipboard commands, on Linux with
+    a shell call, so it is done only once per process.
+    """
+    global _CLIP
+    if _CLIP is None:
+        _CLIP = ClipBoard()
+    return _CLIP
+
+
 class _Keys(object, metaclass=ReadOnlyClass):
     """Internal Keys container class."""
 
@@ -62,19 +196,31 @@ class _Keys(object, metaclass=ReadOnlyClass):
     MATH: str = "_math_"
     RADIUS: str = "_radius_"
     S_BUTTON: str = "_s_button_"
-    S_PANEL: str = "_s_panel_"
+    PERMIT_IMG: str = "_permit_img_"
+    SEARCH_IMG: str = "_search_img_"
     STATUS: str = "_status_"
     SYSTEM: str = "_system_"
+    TREE: str = "_tree_"
+    TREE_TIP: str = "_tree_tip_"
+    TREE_TIP_CELL: str = "_tree_tip_cell_"
+    TREE_TIP_VAR: str = "_tree_tip_var_"
     BUTTON: str = "_button_"
     PARENT: str = "__parent__"
     WINDOWS: str = "__windows__"
 
     CLOSED: str = "__closed__"
     DATA: str = "__rscan_data__"
+    LOG_PREFIX: str = "__log_prefix__"
     START: str = "__start__"
-    STARS: str = "__stars__"
-    RSCAN_TH: str = "__rscan_th__"
-    RSCAN_QTH: str = "__rscan_qth__"
+    STAR_NAMES: str = "__star_names__"
+    STARS_BY_NAME: str = "__stars_by_name__"
+    LAST_LOCATED: str = "__last_located__"
+    SEARCH: str = "__search__"
+    SEARCH_TIME: str = "__search_time__"
+    LAST_RADIUS: str = "__last_radius__"
+    LAST_RADIUS_VAL: str = "__last_radius_val__"
+    ROWS: str = "__rows__"
+    ROWS_JOB: str = "__rows_job__"
 
     WIDGETS_KEY: str = "__widgets__"
     FONT_KEY: str = "__font__"
@@ -108,6 +254,15 @@ class _BEdrsDialog(BData):
     def _r_data(self, value: RscanData) -> None:
         self._set_data(key=_Keys.DATA, value=value, set_default_type=RscanData)
 
+    @property
+    def _log_prefix(self) -> str:
+        """Return 'plugin->class' prefix for log messages, built once."""
+        prefix: Optional[str] = self._get_data(key=_Keys.LOG_PREFIX, default_value=None)  # type: ignore
+        if prefix is None:
+            prefix = f"{self._r_data.plugin_name}->{self._c_name}"
+            self._set_data(key=_Keys.LOG_PREFIX, value=prefix, set_default_type=str)
+        return prefix
+
     @property
     def _fonts(self) -> BData:
         if self._get_data(key=_Keys.FONT_KEY, default_value=None) is None:  # type: ignore
@@ -135,12 +290,20 @@ class _BEdrsDialog(BData):
         self._set_data(key=_Keys.WINDOWS, value=value, set_default_type=List)
 
     @property
-    def _stars(self) -> List:
-        return self._get_data(key=_Keys.STARS, default_value=None)  # type: ignore
+    def _star_names(self) -> List[str]:
+        return self._get_data(key=_Keys.STAR_NAMES, default_value=None)  # type: ignore
 
-    @_stars.setter
-    def _stars(self, value: List) -> None:
-        self._set_data(key=_Keys.STARS, value=value, set_default_type=List)
+    @_star_names.setter
+    def _star_names(self, value: List) -> None:
+        self._set_data(key=_Keys.STAR_NAMES, value=value, set_default_type=List)
+
+    @property
+    def _stars_by_name(self) -> Dict[str, str]:
+        return self._get_data(key=_Keys.STARS_BY_NAME, default_value=None)  # type: ignore
+
+    @_stars_by_name.setter
+    def _stars_by_name(self, value: Dict) -> None:
+        self._set_data(key=_Keys.STARS_BY_NAME, value=value, set_default_type=Dict)
 
     @property
     def _start(self) -> StarsSystem:
@@ -156,7 +319,7 @@ class EdrsScanDialog(tk.Toplevel, TkBase, BLogClient, _BEdrsDialog):
 
     def __init__(
         self,
-        log_queue: Union[Queue, SimpleQueue],
+        log_queue: SimpleQueue,
         data: RscanData,
         euclid_alg: Euclid,
         master=None,
@@ -166,7 +329,7 @@ class EdrsScanDialog(tk.Toplevel, TkBase, BLogClient, _BEdrsDialog):
 
         # tools
         self._tools._set_data(
-            key=_Keys.CLIP, value=ClipBoard(), set_default_type=ClipBoard
+            key=_Keys.CLIP, value=_shared_clip(), set_default_type=ClipBoard
         )
         # Euclid's algorithm for calculating the length of vectors
         self._tools._set_data(
@@ -180,82 +343,69 @@ class EdrsScanDialog(tk.Toplevel, TkBase, BLogClient, _BEdrsDialog):
             key=_Keys.STATUS, value=None, set_default_type=Optional[tk.StringVar]
         )
         self._widgets._set_data(
-            key=_Keys.F_DATA, value=None, set_default_type=Optional[tk.LabelFrame]
+            key=_Keys.F_DATA, value=None, set_default_type=Optional[ttk.LabelFrame]
         )
         self._widgets._set_data(
-            key=_Keys.SYSTEM, value=None, set_default_type=Optional[tk.Entry]
+            key=_Keys.SYSTEM, value=None, set_default_type=Optional[tk.StringVar]
         )
         self._widgets._set_data(
-            key=_Keys.RADIUS, value=None, set_default_type=Optional[tk.Entry]
+            key=_Keys.RADIUS, value=None, set_default_type=Optional[tk.StringVar]
         )
         self._widgets._set_data(
             key=_Keys.S_BUTTON, value=None, set_default_type=Optional[tk.Button]
         )
         self._widgets._set_data(
-            key=_Keys.S_PANEL,
-            value=None,
-            set_default_type=Optional[VerticalScrolledTkFrame],
+            key=_Keys.TREE, value=None, set_default_type=Optional[ttk.Treeview]
+        )
+        self._widgets._set_data(
+            key=_Keys.PERMIT_IMG, value=None, set_default_type=Optional[tk.PhotoImage]
+        )
+        self._widgets._set_data(
+            key=_Keys.SEARCH_IMG, value=None, set_default_type=Optional[tk.PhotoImage]
         )
 
         # init log subsystem
         self.logger = LogClient(log_queue)
 
         self._r_data = data
-        self.debug(currentframe(), f"{self._r_data}")
+        self.debug("__init__", lambda: f"{self._r_data}")
 
-        self.debug(currentframe(), "Initialize dataset")
+        self.debug("__init__", "Initialize dataset")
 
-        # list of found systems: [[system, frame, label with name],...]
-        self._stars = []
+        # names of found systems, indexed by the tree row, and row iids by system name
+        self._star_names = []
+        self._stars_by_name = {}
+        # name of the system handled by the last dialog_update
+        self._set_data(
+            key=_Keys.LAST_LOCATED, value=None, set_default_type=Optional[str]
+        )
 
         if self._r_data.stars_system.name is not None:
             self._start = self._r_data.stars_system
 
-        # starting worker th
+        # tree cell under the pointer, for which the tooltip text was set
         self._set_data(
-            key=_Keys.RSCAN_QTH,
-            value=SimpleQueue(),
-            set_default_type=Union[Queue, SimpleQueue],
+            key=_Keys.TREE_TIP_CELL, value=None, set_default_type=Optional[tuple]
         )
-        self._set_data(
-            key=_Keys.RSCAN_TH,
-            value=Thread(
-                target=self.th_worker,
-                name=f"{self._r_data.plugin_name} worker",
-                daemon=True,
-            ),
-            set_default_type=Thread,
-        )
-        self.__rscan_th.start()
 
-        # fonts configure
-        self._fonts._set_data(
-            key=_FontKeys.FONT_BOLD,
-            value=font.Font(
-                family=_FontFamily.HELVETICA,
-                size=10,
-                weight=font.BOLD,
-                overstrike=False,
-            ),
-            set_default_type=font.Font,
+        # search thread in progress and its start time
+        self._set_data(
+            key=_Keys.SEARCH, value=None, set_default_type=Optional[ThSystemSearch]
         )
-        self._fonts._set_data(
-            key=_FontKeys.FONT_NORMAL,
-            value=font.Font(
-                family=_FontFamily.HELVETICA,
-                size=10,
-                overstrike=False,
-            ),
-            set_default_type=font.Font,
+        self._set_data(key=_Keys.SEARCH_TIME, value=0.0, set_default_type=float)
+        # last validated radius text and its value
+        self._set_data(
+            key=_Keys.LAST_RADIUS, value=None, set_default_type=Optional[str]
         )
-        self._fonts._set_data(
-            key=_FontKeys.FONT_STRIKE,
-            value=font.Font(
-                family=_FontFamily.HELVETICA,
-                size=10,
-                overstrike=True,
-            ),
-            set_default_type=font.Font,
+        self._set_data(key=_Keys.LAST_RADIUS_VAL, value=0.0, set_default_type=float)
+        # content of the tree rows set by last fill, to skip unchanged rows
+        self._set_data(key=_Keys.ROWS, value=[], set_default_type=List)
+        # after_idle job id, which inserts the next chunk of the tree rows
+        self._set_data(key=_Keys.ROWS_JOB, value=None, set_default_type=Optional[str])
+
+        # fonts shared by all dialog windows
+        self._set_data(
+            key=_Keys.FONT_KEY, value=_shared_fonts(self), set_default_type=BData
         )
 
         # closed flag
@@ -264,19 +414,19 @@ class EdrsScanDialog(tk.Toplevel, TkBase, BLogClient, _BEdrsDialog):
         # create window
         self.__frame_build()
 
-        self.debug(currentframe(), "Constructor work done.")
+        self.debug("__init__", "Constructor work done.")
 
     @property
     def __clip(self) -> ClipBoard:
         return self._tools._get_data(key=_Keys.CLIP)  # type: ignore
 
     @property
-    def __rscan_th(self) -> Thread:
-        return self._get_data(key=_Keys.RSCAN_TH)  # type: ignore
+    def __tree(self) -> ttk.Treeview:
+        return self._widgets._get_data(key=_Keys.TREE)  # type: ignore
 
     @property
-    def __rscan_qth(self) -> Union[Queue, SimpleQueue]:
-        return self._get_data(key=_Keys.RSCAN_QTH)  # type: ignore
+    def __search(self) -> Optional[ThSystemSearch]:
+        return self._get_data(key=_Keys.SEARCH)  # type: ignore
 
     def __frame_build(self) -> None:
         """Create window."""
@@ -304,7 +454,7 @@ class EdrsScanDialog(tk.Toplevel, TkBase, BLogClient, _BEdrsDialog):
         label.grid(row=r_label_idx, column=0, columnspan=2)
 
         # create command panel
-        command_frame = tk.LabelFrame(self, text=" Generator ")
+        command_frame = ttk.LabelFrame(self, text=" Generator ")
         command_frame.grid(
             row=r_comm_idx,
             column=0,
@@ -322,23 +472,31 @@ class EdrsScanDialog(tk.Toplevel, TkBase, BLogClient, _BEdrsDialog):
         command_frame.columnconfigure(4, weight=1)
         command_frame.rowconfigure(0, weight=1)
         tk.Label(command_frame, text="Start system:").grid(row=0, column=0, sticky=tk.E)
-        system_name = tk.Entry(command_frame, textvariable=tk.StringVar(value=""))
+        system_var = tk.StringVar(self, value="")
+        if self._r_data.stars_system.name is not None:
+            system_var.set(self._r_data.stars_system.name)
+        system_name = tk.Entry(command_frame, textvariable=system_var)
         system_name.grid(row=0, column=1, sticky=tk.EW)
         system_name.bind("<Return>", self.__generator)
-        if self._r_data.stars_system.name is not None:
-            system_name.delete(0, tk.END)
-            system_name.insert(0, self._r_data.stars_system.name)
-        self._widgets._set_data(key=_Keys.SYSTEM, value=system_name)
+        self._widgets._set_data(key=_Keys.SYSTEM, value=system_var)
         tk.Label(command_frame, text="Radius:").grid(row=0, column=2, sticky=tk.E)
-        radius = tk.Entry(command_frame, textvariable=tk.StringVar(value="10"), width=5)
+        radius_var = tk.StringVar(self, value="10")
+        radius = tk.Entry(command_frame, textvariable=radius_var, width=5)
         radius.bind("<Return>", self.__generator)
         radius.grid(row=0, column=3, sticky=tk.W)
-        self._widgets._set_data(key=_Keys.RADIUS, value=radius)
-        b_generator_img = tk.PhotoImage(data=Pics.SEARCH_16)
+        self._widgets._set_data(key=_Keys.RADIUS, value=radius_var)
+        # the images are shared by all windows
+        self._widgets._set_data(
+            key=_Keys.SEARCH_IMG, value=_shared_image(self, Pics.SEARCH_16)
+        )
+        self._widgets._set_data(
+            key=_Keys.PERMIT_IMG, value=_shared_image(self, Pics.PERMIT_16)
+        )
         b_generator = tk.Button(
-            command_frame, image=b_generator_img, command=self.__generator
+            command_frame,
+            image=self._widgets._get_data(key=_Keys.SEARCH_IMG),  # type: ignore
+            command=self.__generator,
         )
-        b_generator.image = b_generator_img  # type: ignore
         b_generator.grid(row=0, column=4, ipadx=2, sticky=tk.E)
         CreateToolTip(
             b_generator, "Locate visited systems that have not been explored."
@@ -346,21 +504,59 @@ class EdrsScanDialog(tk.Toplevel, TkBase, BLogClient, _BEdrsDialog):
         self._widgets._set_data(key=_Keys.S_BUTTON, value=b_generator)
 
         # create data panel
-        data_frame = tk.LabelFrame(self, text=" Flight route ")
+        data_frame = ttk.LabelFrame(self, text=" Flight route ", width=590, height=250)
         data_frame.grid(
             row=r_data_idx, column=0, columnspan=2, padx=5, pady=5, sticky=tk.NSEW
         )
+        # the size is given by the window grid, so filling the tree
+        # does not propagate the layout up to the window
+        data_frame.pack_propagate(False)
         self._widgets._set_data(key=_Keys.F_DATA, value=data_frame)
 
-        # create scrolled panel
-        s_panel = VerticalScrolledTkFrame(
+        # create found systems tree
+        tree = ttk.Treeview(
             data_frame,
-            borderwidth=2,
-            relief=tk.FLAT,
-            background="light gray",
+            columns=(_Columns.COUNT, _Columns.NAME, _Columns.DISTANCE, _Columns.COPY),
+            selectmode=tk.BROWSE,
+            style=_RowStyles.TREE,
+        )
+        tree.heading("#0", text="")
+        tree.column("#0", width=28, minwidth=28, stretch=tk.FALSE)
+        tree.heading(_Columns.COUNT, text="#")
+        tree.column(_Columns.COUNT, width=40, anchor=tk.E, stretch=tk.FALSE)
+        tree.heading(_Columns.NAME, text="System", anchor=tk.W)
+        tree.column(_Columns.NAME, width=250, anchor=tk.W)
+        tree.heading(_Columns.DISTANCE, text="Distance")
+        tree.column(_Columns.DISTANCE, width=100, anchor=tk.E, stretch=tk.FALSE)
+        tree.heading(_Columns.COPY, text="")
+        tree.column(_Columns.COPY, width=50, anchor=tk.CENTER, stretch=tk.FALSE)
+        tree.tag_configure(
+            _RowStyles.WARN,
+            font=self._fonts._get_data(key=_FontKeys.FONT_BOLD),  # type: ignore
+            foreground="red",
+        )
+        tree.tag_configure(
+            _RowStyles.VISITED,
+            font=self._fonts._get_data(key=_FontKeys.FONT_STRIKE),  # type: ignore
         )
-        s_panel.pack(ipadx=1, ipady=1, fill=tk.BOTH, expand=tk.TRUE)
-        self._widgets._set_data(key=_Keys.S_PANEL, value=s_panel)
+        tree.bind("<ButtonRelease-1>", self.__on_tree_click)
+        tree.bind("<Double-1>", self.__on_tree_double_click)
+        v_scroll = ttk.Scrollbar(data_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=v_scroll.set)
+        v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=tk.TRUE)
+        # one tooltip for the whole tree, its text follows the pointer
+        tree_tip = tk.StringVar(self, value="")
+        self._widgets._set_data(
+            key=_Keys.TREE_TIP,
+            value=CreateToolTip(tree, tree_tip),
+            set_default_type=CreateToolTip,
+        )
+        self._widgets._set_data(
+            key=_Keys.TREE_TIP_VAR, value=tree_tip, set_default_type=tk.StringVar
+        )
+        tree.bind("<Motion>", self.__on_tree_motion, add="+")
+        self._widgets._set_data(key=_Keys.TREE, value=tree)
 
         # create status panel
         status_frame = tk.Frame(self)
@@ -382,52 +578,122 @@ class EdrsScanDialog(tk.Toplevel, TkBase, BLogClient, _BEdrsDialog):
 
     def __on_closing(self) -> None:
         """Run on closing event."""
-        self.debug(currentframe(), "Window is closing now.")
+        self.debug("__on_closing", "Window is closing now.")
         self._set_data(
             key=_Keys.CLOSED,
             value=True,
         )
-        self.__rscan_qth.put(None)
-        self.destroy()
+        if self.__search is not None:
+            self.__search.stop()
+        # the window is only hidden, EdrsDialog reuses it on the next click
+        self.withdraw()
+
+    def reopen(self) -> None:
+        """Show the closed window again, with a clean state."""
+        self.debug("reopen", "Window is reused now.")
+        search: Optional[ThSystemSearch] = self.__search
+        if search is not None:
+            search.stop()
+            self._set_data(key=_Keys.SEARCH, value=None)
+            self.__disable_button(False)
+        self.__process_work_output([])
+        self.status = ""
+        if self._r_data.stars_system.name is not None:
+            self._start = self._r_data.stars_system
+            self._widgets._get_data(key=_Keys.SYSTEM).set(  # type: ignore
+                self._r_data.stars_system.name
+            )
+        self._set_data(key=_Keys.CLOSED, value=False)
+        self.deiconify()
+        self.lift()
 
     def __to_clipboard(self, clip_text: str) -> None:
         """Copy txt to clipboard."""
         # USE: command=lambda: self.__to_clipboard('txt')
-        self.debug(currentframe(), f"string: '{clip_text}'")
+        self.debug("__to_clipboard", lambda: f"string: '{clip_text}'")
         if self.__clip.is_tool:
             self.__clip.copy(clip_text)
         else:
-            clip = tk.Tk()
-            clip.withdraw()
-            clip.clipboard_clear()
-            clip.clipboard_append(clip_text)
-            clip.update()
-            clip.destroy()
+            self.clipboard_clear()
+            self.clipboard_append(clip_text)
+            self.update_idletasks()
+
+    def __on_tree_click(self, event: tk.Event) -> None:
+        """Copy name of the system, if the copy cell of the row was clicked."""
+        tree: ttk.Treeview = self.__tree
+        if tree.identify_region(event.x, event.y) != "cell":
+            return
+        if tree.column(tree.identify_column(event.x), "id") != _Columns.COPY:
+            return
+        iid: str = tree.identify_row(event.y)
+        if iid:
+            # the row values, not _star_names: old rows stay clickable
+            # while the tree is refilled in chunks
+            self.__to_clipboard(tree.set(iid, _Columns.NAME))
+
+    def __on_tree_motion(self, event: tk.Event) -> None:
+        """Set tooltip text for the tree cell under the pointer."""
+        tree: ttk.Treeview = self.__tree
+        iid: str = tree.identify_row(event.y)
+        column: str = tree.identify_column(event.x)
+        cell: tuple = (iid, column)
+        if cell == self._get_data(key=_Keys.TREE_TIP_CELL):
+            return
+        self._set_data(key=_Keys.TREE_TIP_CELL, value=cell)
+        text: str = ""
+        if iid and tree.identify_region(event.x, event.y) in ("cell", "tree"):
+            c_id: str = tree.column(column, "id")
+            if c_id == _Columns.COPY:
+                text = _Tips.COPY
+            elif c_id == _Columns.DISTANCE and tree.tag_has(_RowStyles.WARN, iid):
+                text = _Tips.JUMP
+            elif column == "#0" and tree.item(iid, "image"):
+                text = _Tips.PERMIT
+        tip_var: tk.StringVar = self._widgets._get_data(key=_Keys.TREE_TIP_VAR)  # type: ignore
+        if text != tip_var.get():
+            tip_var.set(text)
+            self._widgets._get_data(key=_Keys.TREE_TIP).refresh()  # type: ignore
+
+    def __on_tree_double_click(self, event: tk.Event) -> None:
+        """Copy name of the double clicked system."""
+        tree: ttk.Treeview = self.__tree
+        if tree.identify_region(event.x, event.y) not in ("cell", "tree"):
+            return
+        iid: str = tree.identify_row(event.y)
+        # the copy cell was already handled by the single click
+        if iid and tree.column(tree.identify_column(event.x), "id") != _Columns.COPY:
+            self.__to_clipboard(tree.set(iid, _Columns.NAME))
 
     def __generator(self, event: Optional[tk.Event] = None) -> None:
         """Command button callback."""
+        # the entries still accept <Return> while the search is running
+        if self.__search is not None:
+            return
         # get variables
-        system = self._widgets._get_data(key=_Keys.SYSTEM).get()  # type: ignore
-        radius = self._widgets._get_data(key=_Keys.RADIUS).get()  # type: ignore
-        self.debug(currentframe(), f"system: {system}, type:{type(system)}")
-        self.debug(currentframe(), f"radius: {radius}, type:{type(radius)}")
-
-        if not system or not radius:
-            msg: str = ""
-            if not system:
-                msg = "system"
-            if not radius and msg:
-                msg = f"{msg} and radius"
-            elif not radius:
-                msg = "radius"
-            msg = f"{msg} must be set for processing request."
-            self.status = msg
+        widgets: BData = self._widgets
+        system = widgets._get_data(key=_Keys.SYSTEM).get()  # type: ignore
+        radius = widgets._get_data(key=_Keys.RADIUS).get()  # type: ignore
+        self.debug("__generator", lambda: f"system: {system}, type:{type(system)}")
+        self.debug("__generator", lambda: f"radius: {radius}, type:{type(radius)}")
+
+        missing: List[str] = [
+            name
+            for name, value in (("system", system), ("radius", radius))
+            if not value
+        ]
+        if missing:
+            self.status = f"{' and '.join(missing)} must be set for processing request."
             return
 
-        if radius and not Numbers().is_float(radius):
-            msg = "Radius must be set as decimal expression."
-            self.status = msg
-            return
+        # the same radius text is not parsed again
+        if radius != self._get_data(key=_Keys.LAST_RADIUS):
+            try:
+                radius_val: float = float(radius)
+            except ValueError:
+                self.status = "Radius must be set as decimal expression."
+                return
+            self._set_data(key=_Keys.LAST_RADIUS_VAL, value=radius_val)
+            self._set_data(key=_Keys.LAST_RADIUS, value=radius)
 
         # build thread object for worker
         obj = ThSystemSearch(
@@ -436,166 +702,186 @@ class EdrsScanDialog(tk.Toplevel, TkBase, BLogClient, _BEdrsDialog):
             self._r_data,
             self._tools._get_data(key=_Keys.MATH),  # type: ignore
         )
-        obj.radius = radius
+        obj.radius = self._get_data(key=_Keys.LAST_RADIUS_VAL)  # type: ignore
         # initializing start system for search engine
-        if self._start is None:
+        if self._start is None or self._start.name != system:
             self._start = StarsSystem(name=system)
-        if self._start.name != system:
-            self._start.name = None
-            self._start.name = system
         obj.start_system = self._start
 
-        # put it into queue
-        if obj:
-            self.__rscan_qth.put(obj)
+        # start processing request, the result is collected by the poll loop
+        if self.logger.is_info_enabled:
+            self.logger.info = (
+                f"{self._log_prefix}: Get new search work for "
+                f"{obj.start_system.name} with radius: {obj.radius}ly"
+            )
+        self.__disable_button(True)
+        self._set_data(key=_Keys.SEARCH, value=obj)
+        self._set_data(key=_Keys.SEARCH_TIME, value=time.monotonic())
+        obj.start()
+        self.after(200, self.__poll_search)
 
     def __disable_button(self, flag: bool) -> None:
         """Disable generator button on working time."""
-        if self._widgets._get_data(key=_Keys.S_BUTTON) is None:
+        button: Optional[tk.Button] = self._widgets._get_data(key=_Keys.S_BUTTON)  # type: ignore
+        if button is None:
             return
         if isinstance(flag, bool):
-            if flag:
-                self._widgets._get_data(key=_Keys.S_BUTTON).config(state=tk.DISABLED)  # type: ignore
-            else:
-                self._widgets._get_data(key=_Keys.S_BUTTON).config(state=tk.ACTIVE)  # type: ignore
-
-    def th_worker(self) -> None:
-        """Run thread for getting data and computing results."""
-        p_name: str = self._r_data.plugin_name
-        c_name: str = self._c_name
-        if self.logger:
-            self.logger.info = f"{p_name}->{c_name}: Starting worker..."
-        while not self._r_data.shutting_down:
-            item: ThSystemSearch = self.__rscan_qth.get(True)
-            if item is None:
-                break
-            self.__disable_button(True)
-            if self.logger:
-                self.logger.info = (
-                    f"{p_name}->{c_name}: Get new search work for "
-                    f"{item.start_system.name} with radius: {item.radius}ly"
-                )
-            time_start: float = time.time()
-            # start processing request
-            item.start()
-            item.join()
-            # getting results
-            time_stop: float = time.time()
-            if self.logger:
-                self.logger.info = (
-                    f"{p_name}->{c_name}: Work is done in: {int(time_stop-time_start)}s"
-                )
-            self.__process_work_output(item.get_result)
-            self.__disable_button(False)
-        if self.logger:
-            self.logger.info = f"{p_name}->{c_name}: worker finished."
+            button.config(state=tk.DISABLED if flag else tk.ACTIVE)
+
+    def __poll_search(self) -> None:
+        """Check the search thread and show its result, when work is done."""
+        search: Optional[ThSystemSearch] = self.__search
+        if self.is_closed or search is None:
+            return
+        # checked before reading the status, to show the final message
+        alive: bool = search.is_alive()
+        # the status messages of the search are shown from the main loop
+        message: str = search.last_status
+        status: Optional[tk.StringVar] = self.status
+        if message and status is not None and message != status.get():
+            status.set(message)
+        if alive:
+            self.after(200, self.__poll_search)
+            return
+        self._set_data(key=_Keys.SEARCH, value=None)
+        if self.logger.is_info_enabled:
+            work_time: float = time.monotonic() - self._get_data(key=_Keys.SEARCH_TIME)  # type: ignore
+            self.logger.info = f"{self._log_prefix}: Work is done in: {int(work_time)}s"
+        self.__process_work_output(search.get_result)
+        self.__disable_button(False)
 
     def __process_work_output(self, systems: Optional[List[StarsSystem]]) -> None:
-        """Build frame with found systems."""
-        # destroy previous data
-        for item in self._stars:
-            item[1].pack_forget()
-            item[1].destroy()
-        self._stars = []
-        # generate new list
-        count = 0
-
-        if systems:
-            for system in systems:
-                count += 1
-                self.__build_row_frame(count, system)
-
-    def __build_row_frame(self, count: int, item: StarsSystem) -> None:
-        """Construct and return Frame row for search dialog."""
-        list_object = []
-        # StarsSystem [0]
-        list_object.append(item)
-
-        # create frame [1]
-        frame = tk.Frame(
-            self._widgets._get_data(key=_Keys.S_PANEL).interior,  # type: ignore
-            relief=tk.GROOVE,
-            borderwidth=1,
-        )
-        frame.pack(fill=tk.X, expand=tk.TRUE)
-        list_object.append(frame)
-
-        # create count label
-        tk.Label(
-            frame, text=f" {count}: ", font=self._fonts._get_data(key=_FontKeys.FONT_NORMAL)  # type: ignore
-        ).pack(side=tk.LEFT)
-
-        # create name label [2]
-        lname = tk.Label(frame, text=f"{item.name}")
-        lname.pack(side=tk.LEFT)
-        lname["font"] = self._fonts._get_data(key=_FontKeys.FONT_NORMAL)  # type: ignore
-        list_object.append(lname)
-
-        # create range label
-        distance: str = "??"
-        jump = 50
-        if EdsmKeys.DISTANCE in item.data:
-            distance = f"{item.data[EdsmKeys.DISTANCE]:.2f}"
-        label_jump = tk.Label(
-            frame,
-            text=f"[{distance:} ly]",
-            font=self._fonts._get_data(key=_FontKeys.FONT_NORMAL),  # type: ignore
-        )
-        label_jump.pack(side=tk.LEFT)
-        if self._r_data.jump_range:
-            jump: float = self._r_data.jump_range - 4
-        if EdsmKeys.DISTANCE in item.data and item.data[EdsmKeys.DISTANCE] > jump:
-            label_jump["font"] = self._fonts._get_data(key=_FontKeys.FONT_BOLD)  # type: ignore
-            label_jump["fg"] = "red"
-            CreateToolTip(
-                label_jump,
-                "Warning. The calculated distance exceeded the ship's maximum single jump distance.",
-            )
-        # permission
-        if EdsmKeys.REQUIRE_PERMIT in item.data and item.data[EdsmKeys.REQUIRE_PERMIT]:
-            label_permit_img = tk.PhotoImage(data=Pics.PERMIT_16)
-            label_permit = tk.Label(frame, image=label_permit_img)
-            label_permit.image = label_permit_img  # type: ignore
-            label_permit.pack(side=tk.LEFT)
-            CreateToolTip(
-                label_permit,
-                "Warning. Required permissions to enter this system.",
+        """Show found systems in the tree.
+
+        The iid of the tree row is the index of the system in the
+        _star_names list. The rows of previous search are reconfigured
+        in place, if their content has changed, only the surplus is deleted
+        or the missing rows inserted.
+        """
+        job: Optional[str] = self._get_data(key=_Keys.ROWS_JOB)
+        if job is not None:
+            self.after_cancel(job)
+            self._set_data(key=_Keys.ROWS_JOB, value=None)
+        if not systems:
+            systems = []
+        tree: ttk.Treeview = self.__tree
+        old_count: int = len(tree.get_children())
+        self._star_names.clear()
+        self._stars_by_name.clear()
+        self._set_data(key=_Keys.TREE_TIP_CELL, value=None)
+        if old_count:
+            tree.yview_moveto(0)
+        jump_range: Optional[float] = self._r_data.jump_range
+        jump: float = jump_range - 4 if jump_range else 50
+        self.__insert_rows(systems, 0, old_count, jump)
+
+    def __insert_rows(
+        self, systems: List[StarsSystem], start: int, old_count: int, jump: float
+    ) -> None:
+        """Show the next chunk of found systems.
+
+        The rest is scheduled with after_idle, so the window is redrawn
+        and handles events between the chunks of a long list.
+        """
+        self._set_data(key=_Keys.ROWS_JOB, value=None)
+        tree: ttk.Treeview = self.__tree
+        star_names: List[str] = self._star_names
+        rows: List[Optional[tuple]] = self._get_data(key=_Keys.ROWS)  # type: ignore
+        stars_by_name: Dict[str, str] = self._stars_by_name
+        permit_img: tk.PhotoImage = self._widgets._get_data(key=_Keys.PERMIT_IMG)  # type: ignore
+        # loop invariants bound to locals
+        insert = tree.insert
+        item = tree.item
+        k_distance: str = EdsmKeys.DISTANCE
+        k_permit: str = EdsmKeys.REQUIRE_PERMIT
+        warn: tuple = (_RowStyles.WARN,)
+        no_tags: tuple = ()
+        stop: int = min(start + _ROWS_CHUNK, len(systems))
+        for idx in range(start, stop):
+            system: StarsSystem = systems[idx]
+            data: Dict[str, Any] = system.data
+            dist: Optional[float] = data.get(k_distance)
+            # the distance text and the row style are decided in one test
+            if dist is None:
+                dist_text: str = "?? ly"
+                tags: tuple = no_tags
+            else:
+                dist_text = f"{dist:.2f} ly"
+                tags = warn if dist > jump else no_tags
+            iid: str = str(idx)
+            name: str = f"{system.name}"
+            permit: bool = bool(data.get(k_permit))
+            row: tuple = (name, dist_text, permit, tags)
+            if idx < old_count:
+                if rows[idx] != row:
+                    item(
+                        iid,
+                        image=permit_img if permit else "",
+                        values=(f"{idx + 1}", name, dist_text, "Copy"),
+                        tags=tags,
+                    )
+                    rows[idx] = row
+            else:
+                insert(
+                    "",
+                    tk.END,
+                    iid=iid,
+                    image=permit_img if permit else "",
+                    values=(f"{idx + 1}", name, dist_text, "Copy"),
+                    tags=tags,
+                )
+                rows.append(row)
+            star_names.append(name)
+            stars_by_name[name] = iid
+        if stop < len(systems):
+            self._set_data(
+                key=_Keys.ROWS_JOB,
+                value=self.after_idle(
+                    self.__insert_rows, systems, stop, old_count, jump
+                ),
             )
-        # create clipboard button
-        btn_img = tk.PhotoImage(data=Pics.CLIPBOARD_16)
-        btn = tk.Button(
-            frame,
-            # text="C",
-            image=btn_img,
-            command=lambda: self.__to_clipboard(f"{item.name}"),
-            font=self._fonts._get_data(key=_FontKeys.FONT_NORMAL),  # type: ignore
-        )
-        btn.image = btn_img  # type: ignore
-        btn.pack(side=tk.RIGHT)
-        CreateToolTip(btn, "Copy to clipboard")
-
-        # finish
-        self._stars.append(list_object)
+            return
+        if old_count > len(systems):
+            tree.delete(*(str(idx) for idx in range(len(systems), old_count)))
+            del rows[len(systems) :]
+        # all rows are in place, the next dialog_update marks located system
+        self._set_data(key=_Keys.LAST_LOCATED, value=None)
 
     def dialog_update(self) -> None:
         """Update current position in system list."""
-        if self._r_data.shutting_down:
-            self.__rscan_qth.put(None)
-
-        # update located system
-        for item in self._stars:
-            if item[0].name == self._r_data.stars_system.name:
-                item[2][_FontKeys.FONT] = self._fonts._get_data(key=_FontKeys.FONT_STRIKE)  # type: ignore
-
-    def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
-        """Build debug message."""
-        p_name: str = f"{self._r_data.plugin_name}"
-        c_name: str = f"{self._c_name}"
-        m_name: str = f"{currentframe.f_code.co_name}" if currentframe else ""
+        if self._r_data.shutting_down and self.__search is not None:
+            self.__search.stop()
+
+        # update located system, only if it has changed since last call
+        current: str = f"{self._r_data.stars_system.name}"
+        if current == self._get_data(key=_Keys.LAST_LOCATED):
+            return
+        self._set_data(key=_Keys.LAST_LOCATED, value=current)
+        iid: Optional[str] = self._stars_by_name.get(current)
+        if iid is None:
+            return
+        tree: ttk.Treeview = self.__tree
+        if not tree.tag_has(_RowStyles.VISITED, iid):
+            tags = tree.item(iid, "tags") or ()
+            tree.item(iid, tags=(*tags, _RowStyles.VISITED))
+            # the row differs from its cached content now
+            self._get_data(key=_Keys.ROWS)[int(iid)] = None  # type: ignore
+
+    def debug(
+        self, m_name: str = "", message: Union[str, Callable[[], str]] = ""
+    ) -> None:
+        """Build debug message.
+
+        The message can be given as callable, it is called only if the debug
+        level is enabled.
+        """
+        if not self.logger or not self.logger.is_debug_enabled:
+            return
+        if callable(message):
+            message = message()
         if message != "":
             message = f": {message}"
-        if self.logger:
-            self.logger.debug = f"{p_name}->{c_name}.{m_name}{message}"
+        self.logger.debug = f"{self._log_prefix}.{m_name}{message}"
 
     @property
     def is_closed(self) -> bool:
@@ -604,17 +890,18 @@ class EdrsScanDialog(tk.Toplevel, TkBase, BLogClient, _BEdrsDialog):
 
     @property
     def status(self) -> Optional[tk.StringVar]:
-        """Return status object."""
+        """Return status object.
+
+        It is None until the window is built by __frame_build.
+        """
         return self._widgets._get_data(key=_Keys.STATUS)
 
     @status.setter
     def status(self, message) -> None:
         """Set status message."""
-        if self._widgets._get_data(key=_Keys.STATUS) is not None:
-            if message:
-                self._widgets._get_data(key=_Keys.STATUS).set(f"{message}")  # type: ignore
-            else:
-                self._widgets._get_data(key=_Keys.STATUS).set("")  # type: ignore
+        status: Optional[tk.StringVar] = self._widgets._get_data(key=_Keys.STATUS)
+        if status is not None:
+            status.set(message if isinstance(message, str) else f"{message or ''}")
 
 
 class EdrsDialog(BLogClient, _BEdrsDialog):
@@ -623,23 +910,18 @@ class EdrsDialog(BLogClient, _BEdrsDialog):
     def __init__(
         self,
         parent: tk.Frame,
-        log_queue: Union[Queue, SimpleQueue],
+        log_queue: SimpleQueue,
         data: RscanData,
     ) -> None:
         """Initialize datasets."""
+        _require(log_queue, SimpleQueue, self._c_name)
         # init log subsystem
         self.logger = LogClient(log_queue)
 
         self._r_data = data
-        self.debug(currentframe(), f"{self._r_data}")
-
-        if not isinstance(parent, tk.Frame):
-            raise Raise.error(
-                f"tk.Frame type expected, '{type(parent)}' received",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+        self.debug("__init__", lambda: f"{self._r_data}")
+
+        _require(parent, tk.Frame, self._c_name)
         self._parent = parent
 
         self._windows = []
@@ -648,7 +930,13 @@ class EdrsDialog(BLogClient, _BEdrsDialog):
         self._tools._set_data(
             key=_Keys.EUCLID, value=Euclid(log_queue, data), set_default_type=Euclid
         )
-        self._tools._get_data(key=_Keys.EUCLID).benchmark()  # type: ignore
+        # the benchmark runs in background, so the dialog is not blocked,
+        # ThSystemSearch uses the default order of the methods until its end
+        Thread(
+            target=self._tools._get_data(key=_Keys.EUCLID).benchmark,  # type: ignore
+            name=f"{self._r_data.plugin_name} benchmark",
+            daemon=True,
+        ).start()
 
     def button(self) -> ttk.Button:
         """Give me the button for main application frame."""
@@ -665,9 +953,11 @@ class EdrsDialog(BLogClient, _BEdrsDialog):
 
     def dialog_update(self) -> None:
         """Do update for windows."""
+        if not self._windows:
+            return
         self.debug(
-            currentframe(),
-            f"Update init, found {len(self._windows)} windows",
+            "dialog_update",
+            lambda: f"Update init, found {len(self._windows)} windows",
         )
         for window in self._windows:
             if not window.is_closed:
@@ -675,31 +965,42 @@ class EdrsDialog(BLogClient, _BEdrsDialog):
 
     def __bt_callback(self) -> None:
         """Run main button callback."""
-        self.debug(currentframe(), "click!")
-        # purge closed window from list
-        for window in self._windows:
-            if window.is_closed:
-                self._windows.remove(window)
-        # create new window
-        esd = EdrsScanDialog(self.logger.queue, self._r_data, self._tools._get_data(key=_Keys.EUCLID))  # type: ignore
+        self.debug("__bt_callback", "click!")
+        # closed windows are hidden only, reuse one of them if possible
+        esd: Optional[EdrsScanDialog] = next(
+            (window for window in self._windows if window.is_closed), None
+        )
+        if esd is None:
+            # create new window
+            esd = EdrsScanDialog(self.logger.queue, self._r_data, self._tools._get_data(key=_Keys.EUCLID))  # type: ignore
+            self._windows.append(esd)
+        else:
+            esd.reopen()
         if self._r_data.stars_system.name is not None:
             esd.title(f"{self._r_data.plugin_name}: {self._r_data.stars_system.name}")
+        else:
+            esd.title(self._r_data.plugin_name)
 
-        self._windows.append(esd)
         self.debug(
-            currentframe(),
-            f"numbers of windows: {len(self._windows)}",
+            "__bt_callback",
+            lambda: f"numbers of windows: {len(self._windows)}",
         )
 
-    def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
-        """Build debug message."""
-        p_name: str = f"{self._r_data.plugin_name}"
-        c_name: str = f"{self._c_name}"
-        m_name: str = f"{currentframe.f_code.co_name}" if currentframe else ""
+    def debug(
+        self, m_name: str = "", message: Union[str, Callable[[], str]] = ""
+    ) -> None:
+        """Build debug message.
+
+        The message can be given as callable, it is called only if the debug
+        level is enabled.
+        """
+        if not self.logger or not self.logger.is_debug_enabled:
+            return
+        if callable(message):
+            message = message()
         if message != "":
             message = f": {message}"
-        if self.logger:
-            self.logger.debug = f"{p_name}->{c_name}.{m_name}{message}"
+        self.logger.debug = f"{self._log_prefix}.{m_name}{message}"
 
 
 # #[EOF]#######################################################################
@@ -7,13 +7,14 @@
   Purpose: EDRS main class module.
 """
 
-from queue import SimpleQueue
+from queue import Empty, SimpleQueue
 from threading import Thread
+from typing import List, Optional
 
 
 from rscan.jsktoolbox.attribtool import ReadOnlyClass
 from rscan.jsktoolbox.edmctool.base import BLogClient, BLogProcessor
-from rscan.jsktoolbox.edmctool.logs import LogClient, LogProcessor
+from rscan.jsktoolbox.edmctool.logs import Log, LogClient, LogProcessor
 from rscan.jsktoolbox.edmctool.data import RscanData
 from rscan.dialogs import EdrsDialog
 
@@ -71,11 +72,15 @@ class EDRS(BLogProcessor, BLogClient):
         """Def th_logger - thread logs processor."""
         self.logger.info = "Starting logger worker"
         while not self.data.shutting_down:
-            while True:
-                log = self.qlog.get(True)
-                if log is None:
-                    break
-                self.log_processor.send(log)
+            # wait for the first message, then take all already queued
+            batch: List[Optional[Log]] = [self.qlog.get(True)]
+            try:
+                while True:
+                    batch.append(self.qlog.get_nowait())
+            except Empty:
+                pass
+            # None is the wake up signal for checking the shutdown flag
+            self.log_processor.send_batch([log for log in batch if log is not None])
 
 
 # #[EOF]#######################################################################
@@ -59,7 +59,9 @@ class NoDynamicAttributes:
     """
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if not hasattr(self, name):
+        # Class level lookup first: it finds declared attributes and
+        # properties without calling the property getters.
+        if not hasattr(type(self), name) and not hasattr(self, name):
             raise AttributeError(
                 f"Cannot add new attribute '{name}' to {self.__class__.__name__} object"
             )
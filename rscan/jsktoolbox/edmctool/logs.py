@@ -10,7 +10,8 @@
 from inspect import currentframe
 import logging
 import os
-from typing import Union, Optional, List, Dict
+from functools import partial
+from typing import Callable, Union, Optional, List, Dict
 from logging.handlers import RotatingFileHandler
 from queue import Queue, SimpleQueue
 
@@ -31,6 +32,31 @@ class _Keys(object, metaclass=ReadOnlyClass):
     LP_NAME: str = "__log_processor_name__"
 
 
+class _LogThreshold(object):
+    """Lowest loglevel accepted by the log processors.
+
+    Shared between LogProcessor and LogClient instances, so that clients can
+    skip building messages, that would be discarded anyway.
+    Every processor registers its configured loglevel, the clients use the
+    lowest one. INFO is assumed until any processor has set its loglevel.
+    """
+
+    level: int = logging.INFO
+    __levels: Dict[int, int] = {}
+
+    @classmethod
+    def register(cls, processor_id: int, level: int) -> None:
+        """Set loglevel of the processor."""
+        cls.__levels[processor_id] = level
+        cls.level = min(cls.__levels.values())
+
+    @classmethod
+    def unregister(cls, processor_id: int) -> None:
+        """Remove loglevel of the destroyed processor."""
+        cls.__levels.pop(processor_id, None)
+        cls.level = min(cls.__levels.values(), default=logging.INFO)
+
+
 class Log(BData):
     """Create Log container class."""
 
@@ -95,6 +121,7 @@ class LogProcessor(BData):
 
     def __del__(self) -> None:
         """Destroy log instance."""
+        _LogThreshold.unregister(id(self))
         self.close()
 
     @property
@@ -136,35 +163,37 @@ class LogProcessor(BData):
 
     def send(self, message: Log) -> None:
         """Send single message to log engine."""
-        if self.__engine is None:
+        self.send_batch([message])
+
+    def send_batch(self, messages: List[Log]) -> None:
+        """Send list of messages to log engine.
+
+        The levels dispatch table is built once for the whole list.
+        """
+        engine: Optional[logging.Logger] = self.__engine
+        if engine is None:
             return
         lgl = LogLevels()
-        if isinstance(message, Log):
-            if message.loglevel == lgl.critical:
-                for msg in message.log:
-                    self.__engine.critical("%s", msg)
-            elif message.loglevel == lgl.debug:
-                for msg in message.log:
-                    self.__engine.debug("%s", msg)
-            elif message.loglevel == lgl.error:
-                for msg in message.log:
-                    self.__engine.error("%s", msg)
-            elif message.loglevel == lgl.info:
-                for msg in message.log:
-                    self.__engine.info("%s", msg)
-            elif message.loglevel == lgl.warning:
-                for msg in message.log:
-                    self.__engine.warning("%s", msg)
-            else:
-                for msg in message.log:
-                    self.__engine.notset("%s", msg)  # type: ignore
-        else:
-            raise Raise.error(
-                f"Log type expected, {type(message)} received.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+        dispatch: Dict[int, Callable] = {
+            lgl.critical: engine.critical,
+            lgl.debug: engine.debug,
+            lgl.error: engine.error,
+            lgl.info: engine.info,
+            lgl.warning: engine.warning,
+        }
+        for message in messages:
+            if not isinstance(message, Log):
+                raise Raise.error(
+                    f"Log type expected, {type(message)} received.",
+                    TypeError,
+                    self._c_name,
+                    currentframe(),
+                )
+            method: Optional[Callable] = dispatch.get(message.loglevel)
+            if method is None:
+                method = partial(engine.log, message.loglevel)
+            for msg in message.log:
+                method("%s", msg)
 
     @property
     def loglevel(self) -> int:
@@ -192,6 +221,7 @@ class LogProcessor(BData):
             self._set_data(
                 key=_Keys.LOG_LEVEL, value=LogLevels().info, set_default_type=int
             )
+        _LogThreshold.register(id(self), self.loglevel)
         self.__logger_init()
 
 
@@ -213,6 +243,16 @@ class LogClient(BData):
             key=_Keys.LOG_QUEUE,
         )  # type: ignore
 
+    @property
+    def is_debug_enabled(self) -> bool:
+        """Check, if debug messages are accepted by the log processor."""
+        return _LogThreshold.level <= logging.DEBUG
+
+    @property
+    def is_info_enabled(self) -> bool:
+        """Check, if info messages are accepted by the log processor."""
+        return _LogThreshold.level <= logging.INFO
+
     @property
     def critical(self) -> str:
         """Property that returns nothing."""
@@ -13,6 +13,7 @@ import random
 
 from inspect import currentframe
 from queue import Queue, SimpleQueue
+from threading import Event
 from typing import Optional, List, Tuple, Union, Any, Dict
 from types import FrameType, MethodType
 from abc import ABC, abstractmethod
@@ -41,6 +42,26 @@ try:
 except ModuleNotFoundError:
     pass
 
+try:
+    from numba import njit
+
+    @njit(fastmath=True, cache=True)
+    def _numba_euclid(x_1, y_1, z_1, x_2, y_2, z_2):
+        """Compiled distance for Euclid.__numba.
+
+        The coordinates are passed as scalars, so no array is created
+        for a single call.
+        """
+        d_x = x_1 - x_2
+        d_y = y_1 - y_2
+        d_z = z_1 - z_2
+        return (d_x * d_x + d_y * d_y + d_z * d_z) ** 0.5
+
+except ImportError:
+    # numba built against other numpy version raises plain ImportError,
+    # without the compiled function the Euclid.__numba is not registered
+    _numba_euclid = None
+
 
 class IAlg(ABC):
     """Interface for algorithm class ."""
@@ -69,6 +90,7 @@ class _Keys(object, metaclass=ReadOnlyClass):
 
     E_METHODS: str = "__e_methods__"
     R_DATA: str = "__e_r_data__"
+    READY: str = "__e_ready__"
 
 
 class Euclid(BLogClient):
@@ -80,19 +102,24 @@ class Euclid(BLogClient):
     def __init__(self, queue: Union[Queue, SimpleQueue], r_data: RscanData) -> None:
         """Create class object."""
 
+        methods: List[MethodType] = [
+            self.__numpy_l2,
+            self.__numpy,
+            self.__einsum,
+            self.__scipy,
+        ]
+        if _numba_euclid is not None:
+            methods.append(self.__numba)
+        methods.extend((self.__math, self.__core))
         self._set_data(
             key=_Keys.E_METHODS,
             set_default_type=List,
-            value=[
-                self.__numpy_l2,
-                self.__numpy,
-                self.__einsum,
-                self.__scipy,
-                self.__math,
-                self.__core,
-            ],
+            value=methods,
         )
 
+        # set by benchmark, when the methods list is ready to use
+        self._set_data(key=_Keys.READY, set_default_type=Event, value=Event())
+
         # init log subsystem
         if isinstance(queue, (Queue, SimpleQueue)):
             self.logger = LogClient(queue)
@@ -110,7 +137,8 @@ class Euclid(BLogClient):
                 set_default_type=RscanData,
                 value=r_data,
             )
-            self.debug(currentframe(), f"{r_data}")
+            if self.logger and self.logger.is_debug_enabled:
+                self.debug(currentframe(), f"{r_data}")
         else:
             raise Raise.error(
                 f"RscanData type expected, '{type(r_data)}' received",
@@ -131,12 +159,30 @@ class Euclid(BLogClient):
         """Return test list."""
         return self._get_data(key=_Keys.E_METHODS)  # type: ignore
 
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the end of benchmark test.
+
+        Returns True, if the benchmark is done, False on timeout.
+        """
+        return self._get_data(key=_Keys.READY).wait(timeout)  # type: ignore
+
     def benchmark(self) -> None:
         """Do benchmark test.
 
         Compare the computational efficiency of functions for real data
         and choose the right priority of their use.
+        The method can be run in separate thread. The 'distance' method is
+        usable during the test with the default order of the methods, the
+        ranked list replaces it in one step. 'wait_ready' is only needed,
+        if the caller wants the ranked order.
         """
+        try:
+            self.__benchmark()
+        finally:
+            self._get_data(key=_Keys.READY).set()  # type: ignore
+
+    def __benchmark(self) -> None:
+        """Do benchmark test."""
         p_name: str = f"{self.__r_data.plugin_name}"
         c_name: str = f"{self._c_name}"
 
@@ -177,23 +223,29 @@ class Euclid(BLogClient):
 
         # start test
         for item in test:
-            t_start: float = time.time()
+            t_start: float = time.perf_counter()
             for idx in range(0, len(data1)):
                 item(data1[idx], data2[idx])
-            t_stop: float = time.time()
+            t_stop: float = time.perf_counter()
             bench_out[t_stop - t_start] = item
 
-        # optimize list of the methods
-        self.__euclid_methods.clear()
-        for idx in sorted(bench_out.keys()):
-            self.__euclid_methods.append(bench_out[idx])
-            self.debug(currentframe(), f"{idx}: {bench_out[idx]}")
+        # optimize list of the methods, swapped in one step, so 'distance'
+        # called from other thread never sees an empty list
+        self.__euclid_methods[:] = [bench_out[idx] for idx in sorted(bench_out.keys())]
+        if self.logger and self.logger.is_debug_enabled:
+            # one log entry for the whole ranking
+            self.logger.debug = [
+                f"{p_name}->{c_name}.benchmark: {idx}: {bench_out[idx]}"
+                for idx in sorted(bench_out.keys())
+            ]
 
         if self.logger:
             self.logger.info = f"{p_name}->{c_name}: done."
 
     def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
         """Build debug message."""
+        if not self.logger or not self.logger.is_debug_enabled:
+            return
         p_name: str = f"{self.__r_data.plugin_name}"
         c_name: str = f"{self._c_name}"
         m_name: str = (
@@ -269,17 +321,26 @@ class Euclid(BLogClient):
             self.debug(currentframe(), f"{ex}")
         return None
 
+    def __numba(self, point_1: List[float], point_2: List[float]) -> Optional[float]:
+        """Try to use numba lib.
+
+        The calculation compiled by numba, the first call in the benchmark
+        does the compilation. The method is registered only, if numba
+        was imported.
+        """
+        try:
+            return _numba_euclid(*point_1, *point_2)  # type: ignore
+        except Exception as ex:
+            self.debug(currentframe(), f"{ex}")
+        return None
+
     def distance(self, point_1: List[float], point_2: List[float]) -> float:
         """Find the first working algorithm and do the calculations."""
         out: float = None  # type: ignore
-        i = 0
-
-        while out is None:
-            if i < len(self.__euclid_methods):
-                out = self.__euclid_methods[i](point_1, point_2)
-            else:
+        for method in self.__euclid_methods:
+            out = method(point_1, point_2)
+            if out is not None:
                 break
-            i += 1
 
         return out
 
@@ -378,6 +439,8 @@ class AlgAStar(IAlg, BLogClient):
 
     def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
         """Build debug message."""
+        if not self.logger or not self.logger.is_debug_enabled:
+            return
         p_name: str = f"{self.__plugin_name}"
         c_name: str = f"{self._c_name}"
         m_name: str = f"{currentframe.f_code.co_name}" if currentframe else ""
@@ -544,7 +607,8 @@ class AlgTsp(IAlg, BLogClient):
                         self.__points[idx].star_pos, self.__points[idx2].star_pos
                     )
                 )
-        self.debug(currentframe(), f"{self.__tmp}")
+        if self.logger and self.logger.is_debug_enabled:
+            self.debug(currentframe(), f"{self.__tmp}")
 
     def __stage_2_solution(self) -> None:
         """Stage 2: search the solution."""
@@ -606,6 +670,8 @@ class AlgTsp(IAlg, BLogClient):
 
     def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
         """Build debug message."""
+        if not self.logger or not self.logger.is_debug_enabled:
+            return
         p_name: str = f"{self.__plugin_name}"
         c_name: str = f"{self._c_name}"
         m_name: str = f"{currentframe.f_code.co_name}" if currentframe else ""
@@ -722,7 +788,70 @@ class AlgGeneric(IAlg, BLogClient):
          - wynikowa lista punktów bez punktu startowego umieszczana jest w self.__final
         """
 
-        start_t: float = time.time()
+        start_t: float = time.perf_counter()
+        try:
+            self.__final = self.__route_numpy()
+        except Exception as ex:
+            self.debug(currentframe(), f"numpy route failed, fallback: {ex}")
+            self.__final = []
+            self.__route_core()
+
+        # update distance
+        if self.__final:
+            dist: float = self.__math.distance(
+                self.__start_point.star_pos, self.__final[0].star_pos
+            )
+            self.__final[0].data[EdsmKeys.DISTANCE] = dist
+            for item in range(len(self.__final) - 1):
+                dist = self.__math.distance(
+                    self.__final[item].star_pos,
+                    self.__final[item + 1].star_pos,
+                )
+                self.__final[item + 1].data[EdsmKeys.DISTANCE] = dist
+
+        end_t: float = time.perf_counter()
+        self.debug(currentframe(), f"Evolution took {end_t - start_t} seconds.")
+
+    def __route_numpy(self) -> List[StarsSystem]:
+        """Find the nearest neighbour route with numpy.
+
+        For every point x and the current position q the half of squared
+        distance is computed for all points at once as:
+        |x|^2/2 + |q|^2/2 - x.q
+        with |x|^2/2 precomputed once, so the sqrt is not needed
+        for ranking and for the jump range test.
+        Float64 is used, because the coordinates are large compared to the
+        distances between neighbouring systems.
+        The unknown coordinates are converted by numpy to NaN, such systems
+        are out of jump range and are not visited.
+        """
+        out: List[StarsSystem] = []
+        systems: List[StarsSystem] = self.__points
+        if not systems:
+            return out
+        current = np.asarray(self.__start_point.star_pos, dtype=np.float64)
+        if np.isnan(current).any():
+            # the route cannot be calculated without start position
+            return out
+        points = np.asarray([system.star_pos for system in systems], dtype=np.float64)
+        remaining = ~np.isnan(points).any(axis=1)
+        points[~remaining] = 0.0
+        half_norms = 0.5 * np.einsum("ij,ij->i", points, points)
+        limit: float = 0.5 * float(self.__jump_range) ** 2
+        for _ in range(int(remaining.sum())):
+            half_dist2 = half_norms + 0.5 * current.dot(current) - points @ current
+            half_dist2[~remaining] = np.inf
+            idx = int(np.argmin(half_dist2))
+            if half_dist2[idx] > limit:
+                # there is no point in jump range
+                break
+            out.append(systems[idx])
+            remaining[idx] = False
+            current = points[idx]
+        return out
+
+    def __route_core(self) -> None:
+        """Find the nearest neighbour route with Euclid methods."""
         current_point: StarsSystem = self.__start_point
         systems: List[StarsSystem] = self.__points[:]
         remaining_systems: List[StarsSystem] = systems  # lista punktów do odwiedzenia
@@ -751,24 +880,10 @@ class AlgGeneric(IAlg, BLogClient):
             remaining_systems.remove(next_point)
             current_point = next_point  # Aktualizujemy bieżący punkt
 
-        # update distance
-        if self.__final:
-            dist: float = self.__math.distance(
-                self.__start_point.star_pos, self.__final[0].star_pos
-            )
-            self.__final[0].data[EdsmKeys.DISTANCE] = dist
-            for item in range(len(self.__final) - 1):
-                dist = self.__math.distance(
-                    self.__final[item].star_pos,
-                    self.__final[item + 1].star_pos,
-                )
-                self.__final[item + 1].data[EdsmKeys.DISTANCE] = dist
-
-        end_t: float = time.time()
-        self.debug(currentframe(), f"Evolution took {end_t - start_t} seconds.")
-
     def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
         """Build debug message."""
+        if not self.logger or not self.logger.is_debug_enabled:
+            return
         p_name: str = f"{self.__plugin_name}"
         c_name: str = f"{self._c_name}"
         m_name: str = f"{currentframe.f_code.co_name}" if currentframe else ""
@@ -996,6 +1111,8 @@ class AlgGenetic(IAlg, BLogClient):
 
     def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
         """Build debug message."""
+        if not self.logger or not self.logger.is_debug_enabled:
+            return
         p_name: str = f"{self.__plugin_name}"
         c_name: str = f"{self._c_name}"
         m_name: str = f"{currentframe.f_code.co_name}" if currentframe else ""
@@ -1247,7 +1364,7 @@ class AlgGenetic2(IAlg, BLogClient):
 
     def run(self) -> None:
         """Return the best route found after evolution."""
-        start_t: float = time.time()
+        start_t: float = time.perf_counter()
         self.__evolve()
 
         # update distance
@@ -1263,11 +1380,13 @@ class AlgGenetic2(IAlg, BLogClient):
                 )
                 self.__final[item + 1].data[EdsmKeys.DISTANCE] = dist
 
-        end_t: float = time.time()
+        end_t: float = time.perf_counter()
         self.debug(currentframe(), f"Evolution took {end_t - start_t} seconds.")
 
     def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
         """Build debug message."""
+        if not self.logger or not self.logger.is_debug_enabled:
+            return
         p_name: str = f"{self.__plugin_name}"
         c_name: str = f"{self._c_name}"
         m_name: str = f"{currentframe.f_code.co_name}" if currentframe else ""
@@ -1424,7 +1543,7 @@ class AlgSimulatedAnnealing(IAlg, BLogClient):
 
     def run(self) -> None:
         """Perform the Simulated Annealing optimization."""
-        start_t: float = time.time()
+        start_t: float = time.perf_counter()
         systems: List[StarsSystem] = self.__points[:]
         self.__current_solution = systems[:]
         self.__final = systems[:]
@@ -1471,11 +1590,13 @@ class AlgSimulatedAnnealing(IAlg, BLogClient):
                 )
                 self.__final[item + 1].data[EdsmKeys.DISTANCE] = dist
 
-        end_t: float = time.time()
+        end_t: float = time.perf_counter()
         self.debug(currentframe(), f"Evolution took {end_t - start_t} seconds.")
 
     def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
         """Build debug message."""
+        if not self.logger or not self.logger.is_debug_enabled:
+            return
         p_name: str = f"{self.__plugin_name}"
         c_name: str = f"{self._c_name}"
         m_name: str = f"{currentframe.f_code.co_name}" if currentframe else ""
@@ -8,29 +8,78 @@
 """
 
 from inspect import currentframe
-from typing import Optional, List, Dict, Union, Any
+from types import FrameType
+from typing import Callable, Optional, List, Dict, Tuple, Union, Any
 
-from ..attribtool import ReadOnlyClass
 from ..raisetool import Raise
-from ..basetool.data import BData
 from .edsm_keys import EdsmKeys
 
 
-class _Keys(object, metaclass=ReadOnlyClass):
-    """Internal Keys container class."""
+def _check_address(arg: Any) -> Optional[int]:
+    """Return address value or raise TypeError."""
+    if arg is None or isinstance(arg, int):
+        return arg
+    if isinstance(arg, str):
+        return int(arg)
+    raise TypeError("Optional[int]")
 
-    # StarsSystem
-    SS_ADDRESS: str = "__ss_address__"
-    SS_DATA: str = "__ss_data__"
-    SS_NAME: str = "__ss_name__"
-    SS_POS_X: str = "__ss_pos_x__"
-    SS_POS_Y: str = "__ss_pos_y__"
-    SS_POS_Z: str = "__ss_pos_z__"
-    SS_STAR_CLASS: str = "__ss_star_class__"
 
+def _check_coord(arg: Any) -> Optional[Union[float, int]]:
+    """Return coordinate value or raise TypeError."""
+    if arg is None or isinstance(arg, (float, int)):
+        return arg
+    raise TypeError("Optional[Union[float, int]]")
 
-class StarsSystem(BData):
-    """StarsSystem container class."""
+
+def _check_name(arg: Any) -> Optional[str]:
+    """Return name value or raise TypeError."""
+    if arg is None or isinstance(arg, str):
+        return arg
+    raise TypeError("Optional[str]")
+
+
+def _check_str(arg: Any) -> str:
+    """Return string value or raise TypeError."""
+    if isinstance(arg, str):
+        return arg
+    raise TypeError("str")
+
+
+# validators for StarsSystem setters, the TypeError message is the expected type
+_VALIDATORS: Dict[str, Callable[[Any], Any]] = {
+    "address": _check_address,
+    "coord": _check_coord,
+    "name": _check_name,
+    "star_class": _check_str,
+}
+
+# EDSM Api keys copied to the data container as they are
+_EDSM_FIELDS: Tuple[str, ...] = (
+    EdsmKeys.BODY_COUNT,
+    EdsmKeys.COORDS_LOCKED,
+    EdsmKeys.REQUIRE_PERMIT,
+    EdsmKeys.DISTANCE,
+)
+
+# marker for the key missing in EDSM Api dict
+_MISS = object()
+
+
+class StarsSystem(object):
+    """StarsSystem container class.
+
+    The objects are created in bulk from EDSM responses, so the fields are
+    stored in slots instead of BData dictionary. The slots also forbid
+    creation of dynamic attributes.
+    """
+
+    __slots__ = (
+        "__address",
+        "__data",
+        "__name",
+        "__pos",
+        "__star_class",
+    )
 
     def __init__(
         self,
@@ -39,10 +88,18 @@ class StarsSystem(BData):
         star_pos: Optional[List] = None,
     ) -> None:
         """Create Star System object."""
+        self.__data: Optional[Dict] = None
+        self.__star_class: str = ""
+        self.__pos: Tuple = (None, None, None)
         self.name = name
         self.address = address
         self.star_pos = star_pos
 
+    @property
+    def _c_name(self) -> str:
+        """Return class name."""
+        return self.__class__.__name__
+
     def __repr__(self) -> str:
         """Give me class dump."""
         return (
@@ -52,24 +109,40 @@ class StarsSystem(BData):
             f"data={self.data})"
         )
 
+    def __type_error(
+        self, expected: str, arg: Any, frame: Optional[FrameType]
+    ) -> Exception:
+        """Return exception for the value of unexpected type.
+
+        The frame is the one of the setter, that received the value.
+        """
+        return Raise.error(
+            f"{expected} type expected, '{type(arg)}' received.",
+            TypeError,
+            self._c_name,
+            frame,
+        )
+
+    def __valid(self, field: str, arg: Any) -> Any:
+        """Return value checked by the field validator.
+
+        The exception with the caller frame is built only for invalid value.
+        """
+        try:
+            return _VALIDATORS[field](arg)
+        except TypeError as ex:
+            frame: Optional[FrameType] = currentframe()
+            raise self.__type_error(f"{ex}", arg, frame.f_back if frame else None)
+
     @property
     def address(self) -> Optional[int]:
         """Returns address of the star system."""
-        return self._get_data(key=_Keys.SS_ADDRESS, default_value=None)
+        return self.__address
 
     @address.setter
     def address(self, arg: Optional[Union[int, str]]) -> None:
         """Sets  address of the star system."""
-        if isinstance(arg, str):
-            self._set_data(
-                key=_Keys.SS_ADDRESS,
-                value=int(arg),
-                set_default_type=Optional[int],
-            )
-        else:
-            self._set_data(
-                key=_Keys.SS_ADDRESS, value=arg, set_default_type=Optional[int]
-            )
+        self.__address = self.__valid("address", arg)
 
     @property
     def data(self) -> Dict:
@@ -77,86 +150,91 @@ class StarsSystem(BData):
 
         This is dictionary object for storing various elements.
         """
-        if self._get_data(key=_Keys.SS_DATA, default_value=None) is None:
-            self._set_data(key=_Keys.SS_DATA, value={}, set_default_type=Dict)
-        return self._get_data(key=_Keys.SS_DATA)  # type: ignore
+        if self.__data is None:
+            self.__data = {}
+        return self.__data
 
     @data.setter
     def data(self, value: Optional[Dict]) -> None:
         """Initialize or set data container."""
         if value is None:
-            self._set_data(key=_Keys.SS_DATA, value={}, set_default_type=Dict)
-        else:
-            self._set_data(key=_Keys.SS_DATA, value=value, set_default_type=Dict)
+            value = {}
+        elif not isinstance(value, Dict):
+            raise self.__type_error("Dict", value, currentframe())
+        self.__data = value
 
     @property
     def name(self) -> Optional[str]:
         """Returns name of the  star system."""
-        return self._get_data(key=_Keys.SS_NAME, default_value=None)
+        return self.__name
 
     @name.setter
     def name(self, arg: Optional[str]) -> None:
         """Sets name of the star system."""
-        self._set_data(key=_Keys.SS_NAME, value=arg, set_default_type=Optional[str])
+        self.__name = self.__valid("name", arg)
 
     @property
     def pos_x(self) -> Optional[Union[float, int]]:
         """Returns pos_x of the star system."""
-        return self._get_data(key=_Keys.SS_POS_X, default_value=None)
+        return self.__pos[0]
 
     @pos_x.setter
     def pos_x(self, arg: Optional[Union[float, int]]) -> None:
         """Sets pos_x of the star system."""
-        self._set_data(
-            key=_Keys.SS_POS_X, value=arg, set_default_type=Optional[Union[float, int]]
-        )
+        self.__pos = (self.__valid("coord", arg), self.__pos[1], self.__pos[2])
 
     @property
     def pos_y(self) -> Optional[Union[float, int]]:
         """Returns pos_y of the star system."""
-        return self._get_data(key=_Keys.SS_POS_Y, default_value=None)
+        return self.__pos[1]
 
     @pos_y.setter
     def pos_y(self, arg: Optional[Union[float, int]]) -> None:
         """Sets pos_y of the star system."""
-        self._set_data(
-            key=_Keys.SS_POS_Y, value=arg, set_default_type=Optional[Union[float, int]]
-        )
+        self.__pos = (self.__pos[0], self.__valid("coord", arg), self.__pos[2])
 
     @property
     def pos_z(self) -> Optional[Union[float, int]]:
         """Returns pos_z of the star system."""
-        return self._get_data(key=_Keys.SS_POS_Z, default_value=None)
+        return self.__pos[2]
 
     @pos_z.setter
     def pos_z(self, arg: Optional[Union[float, int]]) -> None:
         """Sets pos_z of the star system."""
-        self._set_data(
-            key=_Keys.SS_POS_Z, value=arg, set_default_type=Optional[Union[float, int]]
-        )
+        self.__pos = (self.__pos[0], self.__pos[1], self.__valid("coord", arg))
 
     @property
     def star_class(self) -> str:
         """Returns star class string."""
-        return self._get_data(key=_Keys.SS_STAR_CLASS, default_value="")  # type: ignore
+        return self.__star_class
 
     @star_class.setter
     def star_class(self, value: str) -> None:
         """Sets star class string."""
-        self._set_data(key=_Keys.SS_STAR_CLASS, value=value, set_default_type=str)
+        self.__star_class = self.__valid("star_class", value)
 
     @property
-    def star_pos(self) -> List:
-        """Returns the star position list."""
-        return [self.pos_x, self.pos_y, self.pos_z]
+    def star_pos(self) -> Tuple:
+        """Returns the star position tuple.
+
+        The tuple is stored, so the getter does not build a new object.
+        """
+        return self.__pos
 
     @star_pos.setter
-    def star_pos(self, arg: Optional[List] = None) -> None:
+    def star_pos(self, arg: Optional[Union[List, Tuple]] = None) -> None:
         """Sets  the star position list."""
         if arg is None:
-            (self.pos_x, self.pos_y, self.pos_z) = (None, None, None)
-        elif isinstance(arg, List) and len(arg) == 3:
-            (self.pos_x, self.pos_y, self.pos_z) = arg
+            self.__pos = (None, None, None)
+        elif isinstance(arg, (List, Tuple)) and len(arg) == 3:
+            # one tuple for all three coordinates, __valid is called here
+            # directly, so the error reports this setter
+            pos_x, pos_y, pos_z = arg
+            self.__pos = (
+                self.__valid("coord", pos_x),
+                self.__valid("coord", pos_y),
+                self.__valid("coord", pos_z),
+            )
         else:
             raise Raise.error(
                 f"List type expected, '{type(arg)}' received.",
@@ -172,20 +250,22 @@ class StarsSystem(BData):
 
         self.name = data.get(EdsmKeys.NAME, self.name)
         self.address = data.get(EdsmKeys.ID64, self.address)
-        if EdsmKeys.COORDS in data and EdsmKeys.X in data[EdsmKeys.COORDS]:
-            self.pos_x = data[EdsmKeys.COORDS].get(EdsmKeys.X, self.pos_x)
-            self.pos_y = data[EdsmKeys.COORDS].get(EdsmKeys.Y, self.pos_y)
-            self.pos_z = data[EdsmKeys.COORDS].get(EdsmKeys.Z, self.pos_z)
-        if EdsmKeys.BODY_COUNT in data:
-            self.data[EdsmKeys.BODY_COUNT] = data[EdsmKeys.BODY_COUNT]
-        if EdsmKeys.COORDS_LOCKED in data:
-            self.data[EdsmKeys.COORDS_LOCKED] = data[EdsmKeys.COORDS_LOCKED]
-        if EdsmKeys.REQUIRE_PERMIT in data:
-            self.data[EdsmKeys.REQUIRE_PERMIT] = data[EdsmKeys.REQUIRE_PERMIT]
-        if EdsmKeys.DISTANCE in data:
-            self.data[EdsmKeys.DISTANCE] = data[EdsmKeys.DISTANCE]
-        if EdsmKeys.BODIES in data:
-            self.data[EdsmKeys.BODIES] = len(data[EdsmKeys.BODIES])
+        coords: Optional[Dict] = data.get(EdsmKeys.COORDS)
+        if coords and EdsmKeys.X in coords:
+            pos_x, pos_y, pos_z = self.__pos
+            self.star_pos = (
+                coords.get(EdsmKeys.X, pos_x),
+                coords.get(EdsmKeys.Y, pos_y),
+                coords.get(EdsmKeys.Z, pos_z),
+            )
+        s_data: Dict = self.data
+        for key in _EDSM_FIELDS:
+            value = data.get(key, _MISS)
+            if value is not _MISS:
+                s_data[key] = value
+        bodies = data.get(EdsmKeys.BODIES, _MISS)
+        if bodies is not _MISS:
+            s_data[EdsmKeys.BODIES] = len(bodies)
 
 
 # #[EOF]#######################################################################
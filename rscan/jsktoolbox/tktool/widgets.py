@@ -30,10 +30,11 @@ class CreateToolTip(TkBase):
 
     __id: Optional[str] = None
     __tw: Optional[tk.Toplevel] = None
+    __label: Optional[tk.Label] = None
     __wait_time: int = None  # type: ignore
     __widget: tk.Misc = None  # type: ignore
     __wrap_length: int = None  # type: ignore
-    __text: Union[str, List[str], Tuple[str]] = None  # type: ignore
+    __text: str = None  # type: ignore
     __text_variable: tk.StringVar = None  # type: ignore
     __label_attr: Dict[str, Any] = None  # type: ignore
 
@@ -90,57 +91,81 @@ class CreateToolTip(TkBase):
 
     def __showtip(self, event: Optional[tk.Event] = None) -> None:
         """Show tooltip."""
+        __text: Union[str, tk.StringVar] = self.text
+        if not (__text.get() if isinstance(__text, tk.StringVar) else __text):
+            # nothing to show
+            return
         __x: int = 0
         __y: int = 0
         __cx: int
         __cy: int
-        __x, __y, __cx, __cy = self.__widget.bbox("insert")  # type: ignore
+        try:
+            __x, __y, __cx, __cy = self.__widget.bbox("insert")  # type: ignore
+        except (tk.TclError, TypeError, ValueError):
+            # widgets like ttk.Treeview have no 'insert' index,
+            # so the tooltip is placed next to the pointer
+            __x, __y = self.__widget.winfo_pointerxy()
+            __x -= self.__widget.winfo_rootx()
+            __y -= self.__widget.winfo_rooty()
         __x += self.__widget.winfo_rootx() + 25
         __y += self.__widget.winfo_rooty() + 20
-        # creates a toplevel window
-        self.__tw = tk.Toplevel(self.__widget)
-        # Leaves only the label and removes the app window
-        self.__tw.wm_overrideredirect(True)
-        self.__tw.wm_geometry(f"+{__x}+{__y}")
-        label = tk.Label(
-            self.__tw,
-            wraplength=self.__wrap_length,
-        )
-        for key in self.__label_attr.keys():
-            label[key.lower()] = self.__label_attr[key]
-        if isinstance(self.text, tk.StringVar):
-            label["textvariable"] = self.text
+        if self.__tw is None or not self.__tw.winfo_exists():
+            # creates a toplevel window once, next time it is only shown
+            self.__tw = tk.Toplevel(self.__widget)
+            # Leaves only the label and removes the app window
+            self.__tw.wm_overrideredirect(True)
+            self.__label = tk.Label(
+                self.__tw,
+                wraplength=self.__wrap_length,
+            )
+            for key in self.__label_attr.keys():
+                self.__label[key.lower()] = self.__label_attr[key]
+            self.__label.pack(ipadx=1)
+            self.__tw.wm_geometry(f"+{__x}+{__y}")
+        else:
+            self.__tw.wm_geometry(f"+{__x}+{__y}")
+            self.__tw.deiconify()
+        if isinstance(__text, tk.StringVar):
+            self.__label["textvariable"] = __text  # type: ignore
         else:
-            label["text"] = self.text
-        label.pack(ipadx=1)
+            self.__label["textvariable"] = ""  # type: ignore
+            self.__label["text"] = __text  # type: ignore
+
+    def refresh(self) -> None:
+        """Hide tooltip and schedule it again.
+
+        Useful for the tooltip with tk.StringVar text, which depends on
+        the pointer position over the widget.
+        """
+        self.__hidetip()
+        self.__schedule()
 
     def __hidetip(self) -> None:
-        """Hide tooltip."""
+        """Hide tooltip.
+
+        The window is withdrawn, not destroyed, to be reused by next show.
+        """
         __tw: Optional[Toplevel] = self.__tw
-        self.__tw = None
-        if __tw:
-            __tw.destroy()
+        if __tw and __tw.winfo_exists():
+            __tw.withdraw()
 
     @property
     def text(self) -> Union[str, tk.StringVar]:
         """Return text message."""
-        if self.__text is None and self.__text_variable is None:
-            self.__text = ""
         if self.__text_variable is None:
-            if isinstance(self.__text, (List, Tuple)):
-                tmp: str = ""
-                for msg in self.__text:
-                    tmp += msg if not tmp else f"\n{msg}"
-                return tmp
-            return self.__text
-        else:
-            return self.__text_variable
+            return self.__text if self.__text is not None else ""
+        return self.__text_variable
 
     @text.setter
     def text(self, value: Union[str, List[str], Tuple[str], tk.StringVar]) -> None:
-        """Set text message object."""
+        """Set text message object.
+
+        The list of lines is joined here, once, not on every show.
+        """
         if isinstance(value, tk.StringVar):
             self.__text_variable = value
+        elif isinstance(value, (List, Tuple)):
+            self.__text = "\n".join(value)
         else:
             self.__text = value
 
@@ -156,6 +181,8 @@ class VerticalScrolledTkFrame(tk.Frame, TkBase):
     __canvas: tk.Canvas = None  # type: ignore
     __interior: tk.Frame = None  # type: ignore
     __interior_id: int = None  # type: ignore
+    __pending_interior: bool = False
+    __pending_canvas: bool = False
 
     def __init__(self, parent: tk.Misc, *args, **kw) -> None:
         tk.Frame.__init__(self, parent, *args, **kw)
@@ -193,27 +220,40 @@ class VerticalScrolledTkFrame(tk.Frame, TkBase):
         return self.__interior
 
     def __configure_interior(self, event: Optional[tk.Event] = None) -> None:
+        # Resize events come in bursts, so the update is done once,
+        # when the event loop becomes idle.
+        if self.__pending_interior:
+            return
+        self.__pending_interior = True
+        self.after_idle(self.__do_configure_interior)
+
+    def __do_configure_interior(self) -> None:
+        self.__pending_interior = False
+        if not self.winfo_exists():
+            return
+        req_width: int = self.__interior.winfo_reqwidth()
         # Update the scrollbar to match the size of the inner frame.
         self.__canvas.config(
-            scrollregion=(
-                0,
-                0,
-                self.__interior.winfo_reqwidth(),
-                self.__interior.winfo_reqheight(),
-            )
+            scrollregion=(0, 0, req_width, self.__interior.winfo_reqheight())
         )
-        if self.__interior.winfo_reqwidth() != self.__canvas.winfo_width():
+        if req_width != self.__canvas.winfo_width():
             # Update the canvas's width to fit the inner frame.
-            self.__canvas.config(width=self.__interior.winfo_reqwidth())
+            self.__canvas.config(width=req_width)
 
     def __configure_canvas(self, event: Optional[tk.Event] = None) -> None:
-        # print(f"{event}")
-        # print(f"{type(event)}")
-        if self.__interior.winfo_reqwidth() != self.__canvas.winfo_width():
+        if self.__pending_canvas:
+            return
+        self.__pending_canvas = True
+        self.after_idle(self.__do_configure_canvas)
+
+    def __do_configure_canvas(self) -> None:
+        self.__pending_canvas = False
+        if not self.winfo_exists():
+            return
+        width: int = self.__canvas.winfo_width()
+        if self.__interior.winfo_reqwidth() != width:
             # Update the inner frame's width to fill the canvas.
-            self.__canvas.itemconfigure(
-                self.__interior_id, width=self.__canvas.winfo_width()
-            )
+            self.__canvas.itemconfigure(self.__interior_id, width=width)
 
     def __bind_mouse(self, event: Optional[tk.Event] = None) -> None:
         # print(f"{event}")
@@ -250,6 +290,8 @@ class VerticalScrolledTtkFrame(ttk.Frame, TkBase):
     __canvas: tk.Canvas = None  # type: ignore
     __interior: ttk.Frame = None  # type: ignore
     __interior_id: int = None  # type: ignore
+    __pending_interior: bool = False
+    __pending_canvas: bool = False
 
     def __init__(self, parent: tk.Misc, *args, **kw) -> None:
         ttk.Frame.__init__(self, parent, *args, **kw)
@@ -287,27 +329,40 @@ class VerticalScrolledTtkFrame(ttk.Frame, TkBase):
         return self.__interior
 
     def __configure_interior(self, event: Optional[tk.Event] = None) -> None:
+        # Resize events come in bursts, so the update is done once,
+        # when the event loop becomes idle.
+        if self.__pending_interior:
+            return
+        self.__pending_interior = True
+        self.after_idle(self.__do_configure_interior)
+
+    def __do_configure_interior(self) -> None:
+        self.__pending_interior = False
+        if not self.winfo_exists():
+            return
+        req_width: int = self.__interior.winfo_reqwidth()
         # Update the scrollbar to match the size of the inner frame.
         self.__canvas.config(
-            scrollregion=(
-                0,
-                0,
-                self.__interior.winfo_reqwidth(),
-                self.__interior.winfo_reqheight(),
-            )
+            scrollregion=(0, 0, req_width, self.__interior.winfo_reqheight())
         )
-        if self.__interior.winfo_reqwidth() != self.__canvas.winfo_width():
+        if req_width != self.__canvas.winfo_width():
             # Update the canvas's width to fit the inner frame.
-            self.__canvas.config(width=self.__interior.winfo_reqwidth())
+            self.__canvas.config(width=req_width)
 
     def __configure_canvas(self, event: tk.Event) -> None:
-        # print(f"{event}")
-        # print(f"{type(event)}")
-        if self.__interior.winfo_reqwidth() != self.__canvas.winfo_width():
+        if self.__pending_canvas:
+            return
+        self.__pending_canvas = True
+        self.after_idle(self.__do_configure_canvas)
+
+    def __do_configure_canvas(self) -> None:
+        self.__pending_canvas = False
+        if not self.winfo_exists():
+            return
+        width: int = self.__canvas.winfo_width()
+        if self.__interior.winfo_reqwidth() != width:
             # Update the inner frame's width to fill the canvas.
-            self.__canvas.itemconfigure(
-                self.__interior_id, width=self.__canvas.winfo_width()
-            )
+            self.__canvas.itemconfigure(self.__interior_id, width=width)
 
     def __bind_mouse(self, event: Optional[tk.Event] = None) -> None:
         # print(f"{event}")
@@ -7,7 +7,7 @@
 """
 
 from inspect import currentframe
-from queue import Queue, SimpleQueue
+from queue import SimpleQueue
 from threading import Event, Thread
 from typing import Any, Dict, List, Optional, Union
 from types import FrameType
@@ -41,6 +41,7 @@ class _Keys(object, metaclass=ReadOnlyClass):
     START_SYSTEM: str = "__ss_start_system__"
     RADIUS: str = "__ss_radius__"
     FOUND: str = "__ss_found__"
+    STATUS: str = "__ss_status__"
 
 
 class ThSystemSearch(Thread, ThBaseObject, BLogClient):
@@ -49,7 +50,7 @@ class ThSystemSearch(Thread, ThBaseObject, BLogClient):
     def __init__(
         self,
         parent,
-        log_queue: Union[Queue, SimpleQueue],
+        log_queue: SimpleQueue,
         data: RscanData,
         euclid_alg: Euclid,
     ) -> None:
@@ -61,7 +62,8 @@ class ThSystemSearch(Thread, ThBaseObject, BLogClient):
         self.logger = LogClient(log_queue)
 
         self._set_data(key=_Keys.R_DATA, value=data, set_default_type=RscanData)
-        self.debug(currentframe(), f"{self._get_data(key=_Keys.R_DATA)}")
+        if self.logger.is_debug_enabled:
+            self.debug(currentframe(), f"{self._get_data(key=_Keys.R_DATA)}")
 
         # Euclid's algorithm for calculating the length of vectors
         self._set_data(
@@ -86,6 +88,7 @@ class ThSystemSearch(Thread, ThBaseObject, BLogClient):
             value=10,
         )
         self._set_data(key=_Keys.FOUND, set_default_type=List, value=[])
+        self._set_data(key=_Keys.STATUS, set_default_type=str, value="")
 
     @property
     def __data(self) -> RscanData:
@@ -110,6 +113,8 @@ class ThSystemSearch(Thread, ThBaseObject, BLogClient):
         p_name: str = self.__data.plugin_name
         c_name: str = self._c_name
         self.logger.info = f"{p_name}->{c_name}: Starting new work..."
+        # the math methods are usable in the default order, the benchmark
+        # running in background only reorders them in one step
         # build radius query
         query_url: Optional[str] = self.__build_radius_query()
         # self.debug(
@@ -122,7 +127,7 @@ class ThSystemSearch(Thread, ThBaseObject, BLogClient):
         url = Url()
         # querying starts database
         systems = url.url_query(query_url)
-        if self.logger:
+        if self.logger and self.logger.is_debug_enabled:
             self.logger.debug = f"Systems from JSON: {systems}"
         if not systems or not isinstance(systems, List):
             return
@@ -142,7 +147,8 @@ class ThSystemSearch(Thread, ThBaseObject, BLogClient):
             f"{len(systems)} systems found, flight route calculations in progress..."
         )
         systems_out: List[StarsSystem] = self.__flight_route_systems(r_systems)
-        self.debug(currentframe(), f"Search result: {systems_out}")
+        if self.logger.is_debug_enabled:
+            self.debug(currentframe(), f"Search result: {systems_out}")
         # put it into result list
         d_sum: float = 0.0
         for item in systems_out:
@@ -154,19 +160,40 @@ class ThSystemSearch(Thread, ThBaseObject, BLogClient):
         )
         self.logger.info = f"{p_name}->{c_name}: Done."
 
-    def debug(self, currentframe: Optional[FrameType], message: str = "") -> None:
-        """Build debug message."""
+    def debug(
+        self, currentframe: Optional[FrameType], message: Union[str, List[str]] = ""
+    ) -> None:
+        """Build debug message.
+
+        The list of messages is sent to the log queue in one put.
+        """
+        if not self.logger or not self.logger.is_debug_enabled:
+            return
         p_name: str = f"{self.__data.plugin_name}"
         c_name: str = f"{self._c_name}"
         m_name: str = f"{currentframe.f_code.co_name}" if currentframe else ""
+        if isinstance(message, List):
+            self.logger.debug = [
+                f"{p_name}->{c_name}.{m_name}: {msg}" for msg in message
+            ]
+            return
         if message != "":
             message = f": {message}"
         self.logger.debug = f"{p_name}->{c_name}.{m_name}{message}"
         # currentframe()
 
     def status(self, message: Any) -> None:
-        """Write message to status bar."""
-        self.__parent.status = f"{message}"  # type: ignore
+        """Set message for status bar.
+
+        Tk is not thread safe, so the message is only stored here,
+        the parent dialog shows the last one from its main loop.
+        """
+        self._set_data(key=_Keys.STATUS, value=f"{message}")
+
+    @property
+    def last_status(self) -> str:
+        """Return last status message."""
+        return self._get_data(key=_Keys.STATUS)  # type: ignore
 
     @property
     def stopped(self) -> bool:
@@ -245,7 +272,8 @@ class ThSystemSearch(Thread, ThBaseObject, BLogClient):
         # updating data for start system, if needed
         if self.start_system.pos_x is None:
             out = url.system_query(self.start_system)
-            self.debug(currentframe(), f"Start System data: {out}")
+            if self.logger.is_debug_enabled:
+                self.debug(currentframe(), f"Start System data: {out}")
             if out:
                 self.start_system.update_from_edsm(out)
 
@@ -259,6 +287,9 @@ class ThSystemSearch(Thread, ThBaseObject, BLogClient):
         systems_count: int = len(systems)
         cur_count = 0
         count = 0
+        # debug messages are collected and logged once after the loop
+        debug_enabled: bool = self.logger.is_debug_enabled
+        debug_msgs: List[str] = []
         for item in systems:
             cur_count += 1
             self.__progress(cur_count, systems_count)
@@ -277,12 +308,12 @@ class ThSystemSearch(Thread, ThBaseObject, BLogClient):
                 system = StarsSystem()
                 system.update_from_edsm(item)
                 system.data[EdsmKeys.BODIES] = None
-                self.debug(
-                    currentframe(),
-                    f"EDSM system nr:{count} {system}",
-                )
+                if debug_enabled:
+                    debug_msgs.append(f"EDSM system nr:{count} {system}")
                 out.append(system)
 
+        if debug_msgs:
+            self.debug(currentframe(), debug_msgs)
         if self.logger:
             self.logger.info = f"Found {count} systems"
         return out
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+  test_math.py
+  Author : Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+
+  Purpose: Tests for route algorithms.
+"""
+
+from queue import SimpleQueue
+
+from rscan.jsktoolbox.edmctool.data import RscanData
+from rscan.jsktoolbox.edmctool.math import AlgGeneric, Euclid
+from rscan.jsktoolbox.edmctool.stars import StarsSystem
+
+
+def _alg(start: StarsSystem, systems: list, jump_range: int = 10) -> AlgGeneric:
+    """Return AlgGeneric object for given systems."""
+    queue = SimpleQueue()
+    return AlgGeneric(
+        start, systems, jump_range, queue, Euclid(queue, RscanData()), "TEST"
+    )
+
+
+def test_route_skips_system_without_position() -> None:
+    """System with unknown coordinates is not put into the route."""
+    near = StarsSystem("near", 1, [3.0, 0.0, 0.0])
+    unknown = StarsSystem("unknown", 2)
+    far = StarsSystem("far", 3, [6.0, 0.0, 0.0])
+    alg = _alg(StarsSystem("start", 0, [0.0, 0.0, 0.0]), [unknown, far, near])
+    alg.run()
+    assert [system.name for system in alg.get_final] == ["near", "far"]
+
+
+def test_route_respects_jump_range_with_unknown_position() -> None:
+    """Unreachable system is not visited, when other one has no position."""
+    unknown = StarsSystem("unknown", 2)
+    distant = StarsSystem("distant", 3, [100.0, 0.0, 0.0])
+    alg = _alg(StarsSystem("start", 0, [0.0, 0.0, 0.0]), [unknown, distant])
+    alg.run()
+    assert alg.get_final == []
+
+
+def test_route_without_start_position() -> None:
+    """Route is empty, when the start system has no position."""
+    near = StarsSystem("near", 1, [3.0, 0.0, 0.0])
+    alg = _alg(StarsSystem("start", 0), [near])
+    alg.run()
+    assert alg.get_final == []
+
+
+# #[EOF]#######################################################################